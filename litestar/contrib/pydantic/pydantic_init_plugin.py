@@ -11,7 +11,7 @@ from litestar._signature.types import ExtendedMsgSpecValidationError
 from litestar.contrib.pydantic.utils import is_pydantic_constrained_field
 from litestar.exceptions import MissingDependencyException
 from litestar.plugins import InitPluginProtocol
-from litestar.typing import _KWARG_META_EXTRACTORS
+from litestar.typing import _KWARG_META_EXTRACTORS, _from_annotation_cached
 from litestar.utils import is_class_and_subclass
 
 try:
@@ -176,5 +176,8 @@ class PydanticInitPlugin(InitPluginProtocol):
         app_config.type_encoders = {**self.encoders(self.prefer_alias), **(app_config.type_encoders or {})}
         app_config.type_decoders = [*self.decoders(), *(app_config.type_decoders or [])]
 
-        _KWARG_META_EXTRACTORS.add(ConstrainedFieldMetaExtractor)
+        if ConstrainedFieldMetaExtractor not in _KWARG_META_EXTRACTORS:
+            _KWARG_META_EXTRACTORS.add(ConstrainedFieldMetaExtractor)
+            # field definitions parsed before the extractor was registered may be missing its metadata
+            _from_annotation_cached.cache_clear()
         return app_config
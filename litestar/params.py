@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
-from typing import TYPE_CHECKING, Any, Hashable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Sequence
 
 from litestar.enums import RequestEncodingType
 from litestar.types import Empty
@@ -152,13 +152,16 @@ class ParameterKwarg(KwargDefinition):
     If set to False, None values will be allowed. Defaults to True.
     """
 
-    def __hash__(self) -> int:  # pragma: no cover
+    def __hash__(self) -> int:
         """Hash the dataclass in a safe way.
 
+        Only scalar fields are hashed, so that unhashable values of other fields (e.g. ``default`` or ``examples``)
+        don't prevent hashing, while equal instances still hash the same.
+
         Returns:
             A hash
         """
-        return sum(hash(v) for v in asdict(self) if isinstance(v, Hashable))
+        return hash((self.query, self.header, self.cookie, self.required, self.title, self.description))
 
 
 def Parameter(
@@ -262,13 +265,16 @@ class BodyKwarg(KwargDefinition):
     multipart_form_part_limit: int | None = field(default=None)
     """The maximal number of allowed parts in a multipart/formdata request. This limit is intended to protect from DoS attacks."""
 
-    def __hash__(self) -> int:  # pragma: no cover
+    def __hash__(self) -> int:
         """Hash the dataclass in a safe way.
 
+        Only scalar fields are hashed, so that unhashable values of other fields (e.g. ``default`` or ``examples``)
+        don't prevent hashing, while equal instances still hash the same.
+
         Returns:
             A hash
         """
-        return sum(hash(v) for v in asdict(self) if isinstance(v, Hashable))
+        return hash((self.media_type, self.multipart_form_part_limit, self.title, self.description))
 
 
 def Body(
@@ -365,10 +371,12 @@ class DependencyKwarg:
     def __hash__(self) -> int:
         """Hash the dataclass in a safe way.
 
+        ``default`` is not hashed as it may be unhashable.
+
         Returns:
             A hash
         """
-        return sum(hash(v) for v in asdict(self) if isinstance(v, Hashable))
+        return hash(self.skip_validation)
 
 
 def Dependency(*, default: Any = Empty, skip_validation: bool = False) -> Any:
@@ -21,5 +21,5 @@ try:
 except ImportError:
     UnionType: TypeAlias = Union  # type: ignore[no-redef]
 
-UnionTypes = {UnionType, Union}
+UnionTypes = frozenset({UnionType, Union})
 TypedDictClass: TypeAlias = Type[_TypedDictMeta]
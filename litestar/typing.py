@@ -2,9 +2,24 @@ from __future__ import annotations
 
 from collections import abc, deque
 from copy import deepcopy
-from dataclasses import dataclass, is_dataclass, replace
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache, wraps
 from inspect import Parameter, Signature
-from typing import Any, AnyStr, Callable, Collection, ForwardRef, Literal, Mapping, Protocol, Sequence, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AnyStr,
+    Callable,
+    ClassVar,
+    Collection,
+    ForwardRef,
+    Literal,
+    Mapping,
+    Protocol,
+    Sequence,
+    TypeVar,
+    cast,
+)
 
 from msgspec import UnsetType
 from typing_extensions import NotRequired, Required, Self, get_args, get_origin, get_type_hints, is_typeddict
@@ -30,9 +45,18 @@ from litestar.utils.typing import (
     unwrap_annotation,
 )
 
+try:
+    from annotated_types import Predicate
+except ImportError:
+    Predicate = None  # type: ignore[assignment,misc]
+
+if TYPE_CHECKING:
+    from litestar.dto.base_dto import AbstractDTO
+
 __all__ = ("FieldDefinition",)
 
 T = TypeVar("T", bound=KwargDefinition)
+ReturnT = TypeVar("ReturnT")
 
 
 class _KwargMetaExtractor(Protocol):
@@ -47,24 +71,133 @@ class _KwargMetaExtractor(Protocol):
 
 _KWARG_META_EXTRACTORS: set[_KwargMetaExtractor] = set()
 
+_abstract_dto_type: type[AbstractDTO] | None = None
+"""``AbstractDTO``, imported on first use as ``litestar.dto`` depends on this module."""
+
+_COMMON_METADATA_ATTRS: tuple[tuple[str, str, str | None], ...] = (
+    ("gt", "gt", None),
+    ("ge", "ge", None),
+    ("lt", "lt", None),
+    ("le", "le", None),
+    ("multiple_of", "multiple_of", None),
+    ("description", "description", None),
+    ("title", "title", None),
+    ("lower_case", "to_lower", None),
+    ("upper_case", "to_upper", None),
+    ("pattern", "regex", "pattern"),
+)
+"""Constraint key, attribute name and fallback attribute name for metadata values of any type."""
+
+_METADATA_ATTRS = (
+    *_COMMON_METADATA_ATTRS,
+    ("min_length", "min_length", None),
+    ("max_length", "max_length", None),
+)
+"""Constraint key, attribute name and fallback attribute name for metadata values of non-sequence types."""
+
+_SEQUENCE_METADATA_ATTRS = (
+    *_COMMON_METADATA_ATTRS,
+    ("min_items", "min_items", "min_length"),
+    ("max_items", "max_items", "max_length"),
+)
+"""Constraint key, attribute name and fallback attribute name for metadata values of sequence types."""
+
+_PREDICATE_CONSTRAINTS: dict[Callable[..., Any], dict[str, Any]] = {
+    str.islower: {"lower_case": True},
+    str.isupper: {"upper_case": True},
+    str.isascii: {"pattern": "[[:ascii:]]"},
+    str.isdigit: {"pattern": "[[:digit:]]"},
+}
+"""A mapping of ``annotated_types.Predicate`` functions to their equivalent constraints."""
+
+_KWARG_DEFINITION_TYPES = (KwargDefinition, DependencyKwarg)
+
+_SIMPLE_TYPES: frozenset[Any] = frozenset({Any, Empty, None, NoneType, bool, bytes, float, int, str})
+"""Leaf annotations that are common enough to warrant a dedicated cache."""
+
+
+def _memoize(fn: Callable[[FieldDefinition], ReturnT]) -> Callable[[FieldDefinition], ReturnT]:
+    """Store the return value of a field definition method in the ``_cache`` of the instance.
+
+    Args:
+        fn: A method that only receives the field definition instance.
+
+    Returns:
+        A wrapped method that computes its value once per instance.
+    """
+    key = fn.__name__
+
+    @wraps(fn)
+    def wrapped(self: FieldDefinition) -> ReturnT:
+        try:
+            return cast("ReturnT", self._cache[key])
+        except KeyError:
+            value = self._cache[key] = fn(self)
+            return value
+
+    return wrapped
+
+
+def _split_kwarg_definition(
+    metadata: tuple[Any, ...],
+) -> tuple[KwargDefinition | DependencyKwarg | None, tuple[Any, ...]]:
+    """Separate kwarg definitions from the rest of the ``Annotated`` metadata in a single pass.
+
+    Args:
+        metadata: Metadata values from an ``Annotated`` annotation.
+
+    Returns:
+        The first kwarg definition found in the metadata, if any, and the metadata without any kwarg definitions.
+    """
+    kwarg_definition: KwargDefinition | DependencyKwarg | None = None
+    rest: list[Any] = []
+    for value in metadata:
+        if isinstance(value, _KWARG_DEFINITION_TYPES):
+            if kwarg_definition is None:
+                kwarg_definition = value
+        else:
+            rest.append(value)
+    return kwarg_definition, tuple(rest)
+
 
 def _unpack_predicate(value: Any) -> dict[str, Any]:
+    if Predicate is None or not isinstance(value, Predicate):
+        return {}
+
     try:
-        from annotated_types import Predicate
+        return dict(_PREDICATE_CONSTRAINTS.get(value.func, {}))
+    except TypeError:  # unhashable predicate function
+        return {}
+
 
-        if isinstance(value, Predicate):
-            if value.func == str.islower:
-                return {"lower_case": True}
-            if value.func == str.isupper:
-                return {"upper_case": True}
-            if value.func == str.isascii:
-                return {"pattern": "[[:ascii:]]"}
-            if value.func == str.isdigit:
-                return {"pattern": "[[:digit:]]"}
-    except ImportError:
-        pass
+@lru_cache(1024)
+def _get_metadata_attrs(value_type: Any, is_sequence_container: bool) -> tuple[tuple[str, str, str | None], ...]:
+    """Get the constraint attributes that are worth looking up on instances of a metadata type.
 
-    return {}
+    Instances of a type without an instance ``__dict__`` and without custom attribute access can only have the
+    attributes that are defined on the type (e.g. as slots), so attributes that don't exist on the type are skipped
+    instead of failing the lookup on every instance. For any other type, all attributes are looked up.
+
+    Args:
+        value_type: The type of a metadata value.
+        is_sequence_container: Whether the annotated type is a sequence container (list, tuple etc...)
+
+    Returns:
+        Entries of ``_METADATA_ATTRS`` or ``_SEQUENCE_METADATA_ATTRS``.
+    """
+    metadata_attrs = _SEQUENCE_METADATA_ATTRS if is_sequence_container else _METADATA_ATTRS
+    if (
+        getattr(value_type, "__dictoffset__", None) != 0
+        or value_type.__getattribute__ is not object.__getattribute__
+        or hasattr(value_type, "__getattr__")
+    ):
+        return metadata_attrs
+
+    return tuple(
+        (key, attr, fallback_attr)
+        for key, attr, fallback_attr in metadata_attrs
+        if hasattr(value_type, attr) or (fallback_attr is not None and hasattr(value_type, fallback_attr))
+    )
 
 
 def _parse_metadata(value: Any, is_sequence_container: bool, extra: dict[str, Any] | None) -> dict[str, Any]:
@@ -78,48 +211,47 @@ def _parse_metadata(value: Any, is_sequence_container: bool, extra: dict[str, An
     Returns:
         A dictionary of constraints, which fulfill the kwargs of a KwargDefinition class.
     """
-    extra = {
-        **cast("dict[str, Any]", extra or getattr(value, "extra", None) or {}),
-        **(getattr(value, "json_schema_extra", None) or {}),
-    }
-    if example := extra.pop("example", None):
+    extra = cast("dict[str, Any]", extra or getattr(value, "extra", None) or {})
+    json_schema_extra = cast("dict[str, Any]", getattr(value, "json_schema_extra", None) or {})
+    if example := json_schema_extra.get("example", extra.get("example")):
         example_list = [Example(value=example)]
     elif examples := getattr(value, "examples", None):
         example_list = [Example(value=example) for example in cast("list[str]", examples)]
     else:
         example_list = None
 
-    return {
-        k: v
-        for k, v in {
-            "gt": getattr(value, "gt", None),
-            "ge": getattr(value, "ge", None),
-            "lt": getattr(value, "lt", None),
-            "le": getattr(value, "le", None),
-            "multiple_of": getattr(value, "multiple_of", None),
-            "min_length": None if is_sequence_container else getattr(value, "min_length", None),
-            "max_length": None if is_sequence_container else getattr(value, "max_length", None),
-            "description": getattr(value, "description", None),
-            "examples": example_list,
-            "title": getattr(value, "title", None),
-            "lower_case": getattr(value, "to_lower", None),
-            "upper_case": getattr(value, "to_upper", None),
-            "pattern": getattr(value, "regex", getattr(value, "pattern", None)),
-            "min_items": getattr(value, "min_items", getattr(value, "min_length", None))
-            if is_sequence_container
-            else None,
-            "max_items": getattr(value, "max_items", getattr(value, "max_length", None))
-            if is_sequence_container
-            else None,
-            "const": getattr(value, "const", None) is not None,
-            **extra,
-        }.items()
-        if v is not None
-    }
+    parsed: dict[str, Any] = {}
+    # mypy does not consider ``type[Any]`` hashable
+    value_type: type = type(value)
+    for key, attr, fallback_attr in _get_metadata_attrs(value_type, is_sequence_container):
+        v = getattr(value, attr, None if fallback_attr is None else getattr(value, fallback_attr, None))
+        if v is not None:
+            parsed[key] = v
+
+    if example_list is not None:
+        parsed["examples"] = example_list
+
+    parsed["const"] = getattr(value, "const", None) is not None
+
+    # values in ``json_schema_extra`` take precedence over those in ``extra``
+    for extra_values in (extra, json_schema_extra):
+        for k, v in extra_values.items():
+            if k == "example":
+                continue
+            if v is None:
+                # a ``None`` value in extra unsets the constraint
+                parsed.pop(k, None)
+            else:
+                parsed[k] = v
+
+    return parsed
 
 
 def _traverse_metadata(
-    metadata: Sequence[Any], is_sequence_container: bool, extra: dict[str, Any] | None
+    metadata: Sequence[Any],
+    is_sequence_container: bool,
+    extra: dict[str, Any] | None,
+    constraints: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """Recursively traverse metadata from a value.
 
@@ -127,24 +259,31 @@ def _traverse_metadata(
         metadata: A list of metadata values from annotation, namely anything stored under Annotated[x, metadata...]
         is_sequence_container: Whether or not the container is a sequence container (list, tuple etc...)
         extra: Extra key values to parse.
+        constraints: A dictionary to collect the constraints into, used when recursing into nested metadata.
 
     Returns:
         A dictionary of constraints, which fulfill the kwargs of a KwargDefinition class.
     """
-    constraints: dict[str, Any] = {}
+    if constraints is None:
+        constraints = {}
+
     for value in metadata:
         if isinstance(value, (list, set, frozenset, deque)):
-            constraints.update(
-                _traverse_metadata(
-                    metadata=cast("Sequence[Any]", value), is_sequence_container=is_sequence_container, extra=extra
-                )
+            _traverse_metadata(
+                metadata=cast("Sequence[Any]", value),
+                is_sequence_container=is_sequence_container,
+                extra=extra,
+                constraints=constraints,
             )
         elif is_annotated_type(value) and (type_args := [v for v in get_args(value) if v is not None]):
             # annotated values can be nested inside other annotated values
             # this behaviour is buggy in python 3.8, hence we need to guard here.
             if len(type_args) > 1:
-                constraints.update(
-                    _traverse_metadata(metadata=type_args[1:], is_sequence_container=is_sequence_container, extra=extra)
+                _traverse_metadata(
+                    metadata=type_args[1:],
+                    is_sequence_container=is_sequence_container,
+                    extra=extra,
+                    constraints=constraints,
                 )
         elif unpacked_predicate := _unpack_predicate(value):
             constraints.update(unpacked_predicate)
@@ -169,6 +308,7 @@ class FieldDefinition:
     """Represents a function parameter or type annotation."""
 
     __slots__ = (
+        "_cache",
         "annotation",
         "args",
         "default",
@@ -214,10 +354,20 @@ class FieldDefinition:
     name: str
     """Field name."""
 
+    # per-instance storage of memoized values, set in ``__post_init__()`` - annotated as ``ClassVar`` so that it isn't
+    # treated as a dataclass field
+    _cache: ClassVar[dict[Any, Any]]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_cache", {})
+
     def __deepcopy__(self, memo: dict[str, Any]) -> Self:
-        return type(self)(**{attr: deepcopy(getattr(self, attr)) for attr in self.__slots__})
+        return type(self)(**{field.name: deepcopy(getattr(self, field.name)) for field in fields(self)})
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, FieldDefinition):
             return False
 
@@ -226,6 +376,7 @@ class FieldDefinition:
 
         return self.annotation == other.annotation  # type: ignore[no-any-return]
 
+    @_memoize
     def __hash__(self) -> int:
         return hash((self.name, self.raw, self.annotation, self.origin, self.inner_types))
 
@@ -233,7 +384,11 @@ class FieldDefinition:
     def _extract_metadata(
         cls, annotation: Any, name: str | None, default: Any, metadata: tuple[Any, ...], extra: dict[str, Any] | None
     ) -> tuple[KwargDefinition | None, dict[str, Any]]:
-        from litestar.dto.base_dto import AbstractDTO
+        global _abstract_dto_type  # noqa: PLW0603
+        if _abstract_dto_type is None:
+            from litestar.dto.base_dto import AbstractDTO
+
+            _abstract_dto_type = AbstractDTO
 
         model = BodyKwarg if name == "data" else ParameterKwarg
 
@@ -246,11 +401,12 @@ class FieldDefinition:
                     extra=extra,
                 )
 
-        if isinstance(annotation, AbstractDTO):
+        if isinstance(annotation, _abstract_dto_type):
             return _create_metadata_from_type(metadata=[annotation], model=model, annotation=annotation, extra=extra)
 
-        if any(isinstance(arg, KwargDefinition) for arg in get_args(annotation)):
-            return next(arg for arg in get_args(annotation) if isinstance(arg, KwargDefinition)), extra or {}
+        kwarg_definition = next((arg for arg in get_args(annotation) if isinstance(arg, KwargDefinition)), None)
+        if kwarg_definition is not None:
+            return kwarg_definition, extra or {}
 
         if metadata:
             return _create_metadata_from_type(metadata=metadata, model=model, annotation=annotation, extra=extra)
@@ -267,6 +423,13 @@ class FieldDefinition:
         return self.default is not Empty and self.default is not Ellipsis
 
     @property
+    @_memoize
+    def _non_optional_annotation(self) -> Any:
+        """The annotation with ``None`` removed, if it is an optional union, otherwise the annotation itself."""
+        return make_non_optional_union(self.annotation) if self.is_optional else self.annotation
+
+    @property
+    @_memoize
     def is_non_string_iterable(self) -> bool:
         """Check if the field type is an Iterable.
 
@@ -274,12 +437,10 @@ class FieldDefinition:
 
         See: https://github.com/litestar-org/litestar/issues/1106
         """
-        annotation = self.annotation
-        if self.is_optional:
-            annotation = make_non_optional_union(annotation)
-        return is_non_string_iterable(annotation)
+        return is_non_string_iterable(self._non_optional_annotation)
 
     @property
+    @_memoize
     def is_non_string_sequence(self) -> bool:
         """Check if the field type is a non-string Sequence.
 
@@ -287,22 +448,22 @@ class FieldDefinition:
 
         See: https://github.com/litestar-org/litestar/issues/1106
         """
-        annotation = self.annotation
-        if self.is_optional:
-            annotation = make_non_optional_union(annotation)
-        return is_non_string_sequence(annotation)
+        return is_non_string_sequence(self._non_optional_annotation)
 
     @property
+    @_memoize
     def is_any(self) -> bool:
         """Check if the field type is Any."""
         return is_any(self.annotation)
 
     @property
+    @_memoize
     def is_generic(self) -> bool:
         """Check if the field type is a custom class extending Generic."""
         return is_generic(self.annotation)
 
     @property
+    @_memoize
     def is_simple_type(self) -> bool:
         """Check if the field type is a singleton value (e.g. int, str etc.)."""
         return not (
@@ -320,6 +481,7 @@ class FieldDefinition:
         return bool(self.kwarg_definition and getattr(self.kwarg_definition, "const", False))
 
     @property
+    @_memoize
     def is_required(self) -> bool:
         """Check if the field should be marked as a required parameter."""
         if Required in self.type_wrappers:  # type: ignore[comparison-overlap]
@@ -349,11 +511,13 @@ class FieldDefinition:
         return isinstance(self.annotation, (str, ForwardRef))
 
     @property
+    @_memoize
     def is_mapping(self) -> bool:
         """Whether the annotation is a mapping or not."""
         return self.is_subclass_of(Mapping)
 
     @property
+    @_memoize
     def is_tuple(self) -> bool:
         """Whether the annotation is a ``tuple`` or not."""
         return self.is_subclass_of(tuple)
@@ -364,11 +528,13 @@ class FieldDefinition:
         return isinstance(self.annotation, TypeVar)
 
     @property
+    @_memoize
     def is_union(self) -> bool:
         """Whether the annotation is a union type or not."""
         return self.origin in UnionTypes
 
     @property
+    @_memoize
     def is_optional(self) -> bool:
         """Whether the annotation is Optional or not."""
         return bool(self.is_union and NoneType in self.args)
@@ -379,16 +545,19 @@ class FieldDefinition:
         return self.annotation is NoneType
 
     @property
+    @_memoize
     def is_collection(self) -> bool:
         """Whether the annotation is a collection type or not."""
         return self.is_subclass_of(Collection)
 
     @property
+    @_memoize
     def is_non_string_collection(self) -> bool:
         """Whether the annotation is a non-string collection type or not."""
         return self.is_collection and not self.is_subclass_of((str, bytes))
 
     @property
+    @_memoize
     def bound_types(self) -> tuple[FieldDefinition, ...] | None:
         """A tuple of bound types - if the annotation is a TypeVar with bound types, otherwise None."""
         if self.is_type_var and (bound := getattr(self.annotation, "__bound__", None)):
@@ -398,6 +567,7 @@ class FieldDefinition:
         return None
 
     @property
+    @_memoize
     def generic_types(self) -> tuple[FieldDefinition, ...] | None:
         """A tuple of generic types passed into the annotation - if its generic."""
         if not (bases := getattr(self.annotation, "__orig_bases__", None)):
@@ -413,12 +583,14 @@ class FieldDefinition:
         return tuple(args)
 
     @property
+    @_memoize
     def is_dataclass_type(self) -> bool:
         """Whether the annotation is a dataclass type or not."""
 
         return is_dataclass(cast("type", self.origin or self.annotation))
 
     @property
+    @_memoize
     def is_typeddict_type(self) -> bool:
         """Whether the type is TypedDict or not."""
 
@@ -436,16 +608,22 @@ class FieldDefinition:
         Returns:
             Whether the annotation is a subtype of the given type(s).
         """
-        if self.origin:
-            if self.origin in UnionTypes:
-                return all(t.is_subclass_of(cl) for t in self.inner_types)
-
-            return self.origin not in UnionTypes and is_class_and_subclass(self.origin, cl)
+        key = ("is_subclass_of", cl)
+        if key in self._cache:
+            return cast("bool", self._cache[key])
 
-        if self.annotation is AnyStr:
-            return is_class_and_subclass(str, cl) or is_class_and_subclass(bytes, cl)
+        if self.origin:
+            if self.is_union:
+                result = all(t.is_subclass_of(cl) for t in self.inner_types)
+            else:
+                result = is_class_and_subclass(self.origin, cl)
+        elif self.annotation is AnyStr:
+            result = is_class_and_subclass(str, cl) or is_class_and_subclass(bytes, cl)
+        else:
+            result = self.annotation is not Any and not self.is_type_var and is_class_and_subclass(self.annotation, cl)
 
-        return self.annotation is not Any and not self.is_type_var and is_class_and_subclass(self.annotation, cl)
+        self._cache[key] = result
+        return result
 
     def has_inner_subclass_of(self, cl: type[Any] | tuple[type[Any], ...]) -> bool:
         """Whether any generic args are a subclass of the given type.
@@ -489,6 +667,25 @@ class FieldDefinition:
         Returns:
             FieldDefinition
         """
+        if not kwargs:
+            # only classes and singletons are cheap enough to hash twice
+            if (type(annotation) is type or annotation is Any or annotation is None) and annotation in _SIMPLE_TYPES:
+                return _from_simple_type(annotation)
+
+            try:
+                key = _AnnotationCacheKey(annotation)
+            except TypeError:
+                # unhashable annotation, e.g. ``Annotated[int, {"a": "b"}]``
+                pass
+            else:
+                return _from_annotation_cached(key)
+
+        return cls._from_annotation(annotation, **kwargs)
+
+    @classmethod
+    def _from_annotation(cls, annotation: Any, **kwargs: Any) -> FieldDefinition:
+        if kwargs and (unknown := kwargs.keys() - _FIELD_NAMES):
+            raise TypeError(f"FieldDefinition.__init__() got an unexpected keyword argument {min(unknown)!r}")
 
         unwrapped, metadata, wrappers = unwrap_annotation(annotation if annotation is not Empty else Any)
         origin = get_origin(unwrapped)
@@ -496,13 +693,10 @@ class FieldDefinition:
         args = () if origin is abc.Callable else get_args(unwrapped)
 
         if not kwargs.get("kwarg_definition"):
-            if isinstance(kwargs.get("default"), (KwargDefinition, DependencyKwarg)):
+            if isinstance(kwargs.get("default"), _KWARG_DEFINITION_TYPES):
                 kwargs["kwarg_definition"] = kwargs.pop("default")
-            elif any(isinstance(v, (KwargDefinition, DependencyKwarg)) for v in metadata):
-                kwargs["kwarg_definition"] = next(
-                    v for v in metadata if isinstance(v, (KwargDefinition, DependencyKwarg))
-                )
-                metadata = tuple(v for v in metadata if not isinstance(v, (KwargDefinition, DependencyKwarg)))
+            elif (split_metadata := _split_kwarg_definition(metadata))[0] is not None:
+                kwargs["kwarg_definition"], metadata = split_metadata
             elif (extra := kwargs.get("extra", {})) and "kwarg_definition" in extra:
                 kwargs["kwarg_definition"] = extra.pop("kwarg_definition")
             else:
@@ -514,25 +708,41 @@ class FieldDefinition:
                     extra=kwargs.get("extra", {}),
                 )
 
-        kwargs.setdefault("annotation", unwrapped)
-        kwargs.setdefault("args", args)
-        kwargs.setdefault("default", Empty)
-        kwargs.setdefault("extra", {})
-        kwargs.setdefault("inner_types", tuple(FieldDefinition.from_annotation(arg) for arg in args))
-        kwargs.setdefault("instantiable_origin", get_instantiable_origin(origin, unwrapped))
-        kwargs.setdefault("kwarg_definition", None)
-        kwargs.setdefault("metadata", metadata)
-        kwargs.setdefault("name", "")
-        kwargs.setdefault("origin", origin)
-        kwargs.setdefault("raw", annotation)
-        kwargs.setdefault("safe_generic_origin", get_safe_generic_origin(origin, unwrapped))
-        kwargs.setdefault("type_wrappers", wrappers)
-
-        instance = FieldDefinition(**kwargs)
-        if not instance.has_default and instance.kwarg_definition:
-            return replace(instance, default=instance.kwarg_definition.default)
-
-        return instance
+        kwarg_definition = kwargs.get("kwarg_definition")
+        default = kwargs.get("default", Empty)
+        if kwarg_definition and (default is Empty or default is Ellipsis):
+            default = kwarg_definition.default
+
+        if "inner_types" in kwargs:
+            inner_types = kwargs["inner_types"]
+        else:
+            inner_types = tuple(FieldDefinition.from_annotation(arg) for arg in args) if args else ()
+
+        if "instantiable_origin" in kwargs:
+            instantiable_origin = kwargs["instantiable_origin"]
+        else:
+            instantiable_origin = get_instantiable_origin(origin, unwrapped)
+
+        if "safe_generic_origin" in kwargs:
+            safe_generic_origin = kwargs["safe_generic_origin"]
+        else:
+            safe_generic_origin = get_safe_generic_origin(origin, unwrapped)
+
+        return FieldDefinition(
+            raw=kwargs.get("raw", annotation),
+            annotation=kwargs.get("annotation", unwrapped),
+            type_wrappers=kwargs.get("type_wrappers", wrappers),
+            origin=kwargs.get("origin", origin),
+            args=kwargs.get("args", args),
+            metadata=kwargs.get("metadata", metadata),
+            instantiable_origin=instantiable_origin,
+            safe_generic_origin=safe_generic_origin,
+            inner_types=inner_types,
+            default=default,
+            extra=kwargs.get("extra", {}),
+            kwarg_definition=kwarg_definition,
+            name=kwargs.get("name", ""),
+        )
 
     @classmethod
     def from_kwarg(
@@ -558,20 +768,15 @@ class FieldDefinition:
             FieldDefinition instance.
         """
 
-        return cls.from_annotation(
-            annotation,
-            name=name,
-            default=default,
-            **{
-                k: v
-                for k, v in {
-                    "inner_types": inner_types,
-                    "kwarg_definition": kwarg_definition,
-                    "extra": extra,
-                }.items()
-                if v is not None
-            },
-        )
+        kwargs: dict[str, Any] = {"name": name, "default": default}
+        if inner_types is not None:
+            kwargs["inner_types"] = inner_types
+        if kwarg_definition is not None:
+            kwargs["kwarg_definition"] = kwarg_definition
+        if extra is not None:
+            kwargs["extra"] = extra
+
+        return cls.from_annotation(annotation, **kwargs)
 
     @classmethod
     def from_parameter(cls, parameter: Parameter, fn_type_hints: dict[str, Any]) -> FieldDefinition:
@@ -618,3 +823,65 @@ class FieldDefinition:
             A boolean.
         """
         return predicate(self) or any(t.match_predicate_recursively(predicate) for t in self.inner_types)
+
+
+_FIELD_NAMES = frozenset(f.name for f in fields(FieldDefinition))
+
+
+class _AnnotationCacheKey:
+    """Cache key for :func:`_from_annotation_cached` that hashes the annotation only once.
+
+    ``Union`` and ``Literal`` compare equal regardless of the order of their args, so the repr of the annotation is
+    part of the key to ensure that the args of the cached instance retain the order in which they were given.
+    """
+
+    __slots__ = ("_hash", "annotation", "annotation_repr")
+
+    def __init__(self, annotation: Any) -> None:
+        """Initialize the key.
+
+        Args:
+            annotation: The type annotation.
+
+        Raises:
+            TypeError: If the annotation is not hashable.
+        """
+        self.annotation = annotation
+        self.annotation_repr = repr(annotation)
+        self._hash = hash((annotation, self.annotation_repr))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _AnnotationCacheKey):
+            return False
+        return (self.annotation, self.annotation_repr) == (other.annotation, other.annotation_repr)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+@lru_cache(2048)
+def _from_annotation_cached(key: _AnnotationCacheKey) -> FieldDefinition:
+    """Create a :class:`FieldDefinition` for an annotation without any additional kwargs.
+
+    Args:
+        key: The cache key of the type annotation.
+
+    Returns:
+        FieldDefinition
+    """
+    return FieldDefinition._from_annotation(key.annotation)
+
+
+@lru_cache(maxsize=None)
+def _from_simple_type(annotation: Any) -> FieldDefinition:
+    """Create a :class:`FieldDefinition` for one of the annotations in ``_SIMPLE_TYPES``.
+
+    These annotations have no args and compare by identity, so they can be cached on the annotation alone.
+
+    Args:
+        annotation: The type annotation.
+
+    Returns:
+        FieldDefinition
+    """
+    return FieldDefinition._from_annotation(annotation)
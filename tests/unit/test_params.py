@@ -1,4 +1,5 @@
-from typing import Any, Dict, Generator, List, Optional
+from functools import partial
+from typing import Any, Callable, Dict, Generator, List, Optional
 
 import pytest
 from typing_extensions import Annotated
@@ -294,3 +295,13 @@ def test_optional_query_parameter_consistency_with_default_queried_with_other_pa
     assert optional_default_client.get("/optional-default", params={"param": "a"}).json() == {"key": None}
     assert optional_default_client.get("/optional-annotated-default", params={"abc": "xyz"}).json() == {"key": None}
     assert optional_default_client.get("/optional-annotated-default", params={"param": "a"}).json() == {"key": None}
+
+
+@pytest.mark.parametrize("make_kwarg", [partial(Parameter, query="key"), partial(Body, title="body"), Dependency])
+def test_kwarg_definition_is_hashable_with_unhashable_default(make_kwarg: Callable[..., Any]) -> None:
+    assert make_kwarg(default=[1]) in {make_kwarg(default=[1])}
+
+
+def test_kwarg_definition_hash_depends_on_fields() -> None:
+    assert hash(Parameter(query="a")) != hash(Parameter(query="b"))
+    assert hash(Body(title="a")) != hash(Body(title="b"))
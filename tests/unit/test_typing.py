@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import sys
-from dataclasses import dataclass
-from typing import Any, ForwardRef, Generic, List, Optional, Tuple, Union
+from copy import deepcopy
+from dataclasses import dataclass, replace
+from typing import Any, ForwardRef, Generic, List, Literal, Optional, Tuple, Union
 
 import pytest
 from typing_extensions import Annotated, TypedDict
 
-from litestar.typing import FieldDefinition
+from litestar.openapi.spec import Example
+from litestar.params import Dependency, Parameter
+from litestar.typing import FieldDefinition, _parse_metadata, _unpack_predicate
 
 from .test_utils.test_signature import T, _check_field_definition, field_definition_int, test_type_hints
 
@@ -286,3 +289,118 @@ def test_field_definition_get_type_hints(annotation: Any, expected_type_hints: d
         FieldDefinition.from_annotation(annotation).get_type_hints(include_extras=True, resolve_generics=True)
         == expected_type_hints
     )
+
+
+def test_field_definition_from_annotation_is_cached() -> None:
+    assert FieldDefinition.from_annotation(int) is FieldDefinition.from_annotation(int)
+    assert FieldDefinition.from_annotation(List[int]) is FieldDefinition.from_annotation(List[int])
+    assert FieldDefinition.from_annotation(List[int], name="foo") is not FieldDefinition.from_annotation(List[int])
+
+
+def test_field_definition_from_annotation_cache_retains_arg_order() -> None:
+    assert FieldDefinition.from_annotation(Union[int, str]).args == (int, str)
+    assert FieldDefinition.from_annotation(Union[str, int]).args == (str, int)
+    assert FieldDefinition.from_annotation(Literal["a", "b"]).args == ("a", "b")
+    assert FieldDefinition.from_annotation(Literal["b", "a"]).args == ("b", "a")
+
+
+def test_field_definition_from_annotation_with_nested_kwarg_definition_is_cached() -> None:
+    annotation = List[Annotated[int, Parameter(query="foo")]]
+    field_definition = FieldDefinition.from_annotation(annotation)
+    assert field_definition is FieldDefinition.from_annotation(annotation)
+    assert field_definition.inner_types[0].kwarg_definition == Parameter(query="foo")
+
+    other_field_definition = FieldDefinition.from_annotation(List[Annotated[int, Parameter(query="bar")]])
+    assert other_field_definition.inner_types[0].kwarg_definition == Parameter(query="bar")
+
+
+def test_field_definition_from_annotation_with_unhashable_annotation() -> None:
+    field_definition = FieldDefinition.from_annotation(Annotated[int, {"foo": "bar"}])
+    assert field_definition.annotation is int
+    assert field_definition.metadata == ({"foo": "bar"},)
+
+
+def test_field_definition_from_annotation_propagates_build_errors_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    class Leaf:
+        ...
+
+    calls = []
+    from_annotation = FieldDefinition._from_annotation
+
+    def _from_annotation(annotation: Any, **kwargs: Any) -> FieldDefinition:
+        calls.append(annotation)
+        if annotation is Leaf:
+            raise TypeError("boom")
+        return from_annotation(annotation, **kwargs)
+
+    monkeypatch.setattr(FieldDefinition, "_from_annotation", _from_annotation)
+    with pytest.raises(TypeError, match="boom"):
+        FieldDefinition.from_annotation(List[List[List[Leaf]]])
+    assert len(calls) == 4
+
+
+def test_field_definition_from_annotation_rejects_unknown_kwargs() -> None:
+    with pytest.raises(TypeError, match="nmae"):
+        FieldDefinition.from_annotation(int, nmae="foo")
+
+
+def test_field_definition_equality_compares_inner_types() -> None:
+    assert FieldDefinition.from_kwarg(List[int], name="a") != FieldDefinition.from_kwarg(
+        List[int], name="a", inner_types=(FieldDefinition.from_annotation(str),)
+    )
+
+
+def test_unpack_predicate_returns_a_copy() -> None:
+    annotated_types = pytest.importorskip("annotated_types")
+    _unpack_predicate(annotated_types.Predicate(str.islower))["lower_case"] = False
+    assert _unpack_predicate(annotated_types.Predicate(str.islower)) == {"lower_case": True}
+
+
+def test_field_definition_memoized_properties_are_not_shared() -> None:
+    field_definition = FieldDefinition.from_annotation(Optional[List[int]])
+    assert field_definition.is_optional is True
+    assert field_definition.is_non_string_sequence is True
+
+    replaced = replace(field_definition, annotation=int, origin=None, args=(), inner_types=())
+    assert replaced.is_optional is False
+    assert replaced.is_non_string_sequence is False
+    assert deepcopy(field_definition) == field_definition
+
+
+def test_parse_metadata_extra() -> None:
+    class Meta:
+        gt = 1
+        lt = 10
+        extra = {"title": "foo", "example": "bar", "lt": None}
+        json_schema_extra = {"title": "baz"}
+
+    assert _parse_metadata(Meta, is_sequence_container=False, extra=None) == {
+        "gt": 1,
+        "examples": [Example(value="bar")],
+        "const": False,
+        "title": "baz",
+    }
+
+
+def test_field_definition_kwarg_definition_from_metadata() -> None:
+    parameter = Parameter(query="foo")
+    field_definition = FieldDefinition.from_annotation(Annotated[int, "bar", parameter, Dependency()])
+    assert field_definition.kwarg_definition is parameter
+    assert field_definition.metadata == ("bar",)
+
+
+def test_parse_metadata_of_slotted_and_dynamic_types() -> None:
+    class Slotted:
+        __slots__ = ("gt", "max_length")
+
+        def __init__(self, gt: int) -> None:
+            self.gt = gt
+
+    class Dynamic:
+        pass
+
+    dynamic = Dynamic()
+    dynamic.lt = 5  # type: ignore[attr-defined]
+
+    assert _parse_metadata(Slotted(1), is_sequence_container=False, extra=None) == {"gt": 1, "const": False}
+    assert _parse_metadata(dynamic, is_sequence_container=False, extra=None) == {"lt": 5, "const": False}